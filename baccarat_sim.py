@@ -9,13 +9,49 @@ baccarat shoe simulator with burn/cut support.
 - outputs a csv of all hands:
     - shoe_id, hand_number, player_cards, banker_cards, player_total,
       banker_total, winner (P/B/T), natural (0/1)
+
+requires numpy >= 1.25. numba is optional: without it the hand kernel runs as
+plain python (same results, much slower). pandas is optional and only
+used to stream the csv. run `python compile_baccarat.py` to build the
+kernel ahead of time and skip the jit warmup.
 """
 
 import argparse
 import csv
-import random
+import multiprocessing as mp
+import os
+from array import array
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+try:
+    from numba import njit, prange, set_num_threads
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - numba is optional
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """no-op stand-in for numba.njit when numba isn't installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+    def set_num_threads(n):
+        pass
+
+try:
+    # built by compile_baccarat.py
+    from baccarat_native import run_all as run_all_native
+except ImportError:
+    run_all_native = None
+
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover - pandas is optional
+    pd = None
 
 
 # ---------- data model ----------
@@ -32,137 +68,389 @@ class HandResult:
     natural: bool
 
 
+# winner codes returned by the kernel index into this string
+WINNER_CODES = "PBT"
+
+# struct-of-arrays hand storage: one parallel numpy array per column.
+#   shoe_id, hand_number        (n,)   int32
+#   p_cards, b_cards            (n, 3) int8, -1 = no third card
+#   p_len, b_len                (n,)   int8, 2 or 3
+#   p_total, b_total            (n,)   int8
+#   winner                      (n,)   int8, index into WINNER_CODES
+#   natural                     (n,)   bool
+Results = Dict[str, np.ndarray]
+
+
+def alloc_results(n: int) -> Results:
+    """
+    preallocate struct-of-arrays storage for `n` hands.
+
+    card triples are left uninitialized: the kernel writes all three slots
+    of every hand it deals (-1 when there's no third card), and rows it
+    never reaches keep hand_number 0 and get dropped by compact_results.
+    """
+    return {
+        "shoe_id": np.zeros(n, dtype=np.int32),
+        "hand_number": np.zeros(n, dtype=np.int32),
+        "p_cards": np.empty((n, 3), dtype=np.int8),
+        "b_cards": np.empty((n, 3), dtype=np.int8),
+        "p_len": np.zeros(n, dtype=np.int8),
+        "b_len": np.zeros(n, dtype=np.int8),
+        "p_total": np.zeros(n, dtype=np.int8),
+        "b_total": np.zeros(n, dtype=np.int8),
+        "winner": np.zeros(n, dtype=np.int8),
+        "natural": np.zeros(n, dtype=np.bool_),
+    }
+
+
+def compact_results(results: Results) -> Results:
+    """
+    drop unused rows (hand_number == 0) left by fixed per-shoe slots.
+    """
+    used = results["hand_number"] > 0
+    return {k: v[used] for k, v in results.items()}
+
+
+def concat_results(parts: List[Results]) -> Results:
+    """
+    stack several result sets row-wise, in the order given.
+    """
+    if not parts:
+        return alloc_results(0)
+    return {k: np.concatenate([p[k] for p in parts]) for k in parts[0]}
+
+
+def _to_handresults(results: Results) -> List[HandResult]:
+    """
+    materialize struct-of-arrays results as HandResult objects, for callers
+    that want the legacy list-of-dataclass shape.
+    """
+    p_cards = results["p_cards"].tolist()
+    b_cards = results["b_cards"].tolist()
+    return [
+        HandResult(
+            shoe_id=shoe_id,
+            hand_number=hand_number,
+            player_cards=p_cards[i][:p_len],
+            banker_cards=b_cards[i][:b_len],
+            player_total=p_total,
+            banker_total=b_total,
+            winner=WINNER_CODES[winner],
+            natural=natural,
+        )
+        for i, (shoe_id, hand_number, p_len, b_len, p_total, b_total, winner, natural)
+        in enumerate(zip(
+            results["shoe_id"].tolist(),
+            results["hand_number"].tolist(),
+            results["p_len"].tolist(),
+            results["b_len"].tolist(),
+            results["p_total"].tolist(),
+            results["b_total"].tolist(),
+            results["winner"].tolist(),
+            results["natural"].tolist(),
+        ))
+    ]
+
+
 # ---------- core baccarat logic ----------
 
-def build_shoe(num_decks: int, rng: random.Random) -> List[int]:
+# one ordered deck as raw int8 ranks (1-13, four of each); shoes are
+# built by repeating it with C-level bytes multiplication
+ONE_DECK = bytes(rank for rank in range(1, 14) for _suit in range(4))
+
+# baccarat value by rank (index 0 unused): 1-9 = 1-9, 10/J/Q/K = 0
+_VAL = (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 0, 0, 0, 0)
+
+
+def build_shoe(num_decks: int, rng: np.random.Generator) -> np.ndarray:
     """
     build an n-deck shoe. we only care about ranks (1–13), suits don’t matter.
+    the shoe is a contiguous int8 array so the numba kernel can walk it,
+    and the shuffle runs in numpy's C loop.
     """
-    shoe: List[int] = []
-    for _ in range(num_decks):
-        for rank in range(1, 14):        # 1-13
-            for _suit in range(4):       # four suits
-                shoe.append(rank)
+    # writable int8 view straight over the repeated deck bytes, no copy
+    shoe = np.frombuffer(bytearray(ONE_DECK * num_decks), dtype=np.int8)
     rng.shuffle(shoe)
     return shoe
 
 
+def build_shoes(
+    num_shoes: int,
+    num_decks: int,
+    rng: np.random.Generator,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    build and shuffle `num_shoes` shoes in one allocation, one shoe per row.
+
+    pass `out` (an int8 buffer with >= num_shoes rows) to refill and
+    reshuffle it in place instead of allocating a new block.
+    """
+    base = np.frombuffer(ONE_DECK * num_decks, dtype=np.int8)
+    if out is None:
+        shoes = np.empty((num_shoes, len(base)), dtype=np.int8)
+    else:
+        shoes = out[:num_shoes]
+    # reset to the ordered deck first so the shuffle doesn't depend on
+    # whatever the buffer held before
+    shoes[:] = base
+    rng.permuted(shoes, axis=1, out=shoes)
+    return shoes
+
+
+def _build_banker_draw() -> np.ndarray:
+    """
+    BANKER_DRAW[b_total, p3_val] is 1 when the banker draws after the
+    player took a third card worth p3_val. totals 8/9 are naturals and
+    never reach the table.
+    """
+    table = np.zeros((8, 10), dtype=np.uint8)
+    table[0:3, :] = 1       # 0-2: always draw
+    table[3, :] = 1         # 3: draw unless player's third card is 8
+    table[3, 8] = 0
+    table[4, 2:8] = 1       # 4: draw on 2-7
+    table[5, 4:8] = 1       # 5: draw on 4-7
+    table[6, 6:8] = 1       # 6: draw on 6-7
+    # 7: always stand
+    return table
+
+
+BANKER_DRAW = _build_banker_draw()
+
+# when the player stands, the banker draws on 0-5
+BANKER_STAND_DRAW = (np.arange(8) <= 5).astype(np.uint8)
+
+
 def baccarat_value(rank: int) -> int:
     """
     convert a rank to baccarat value.
     1-9 = 1-9, 10/J/Q/K = 0
     """
-    return rank if rank < 10 else 0
+    return _VAL[rank]
 
 
 def hand_total(cards: List[int]) -> int:
-    return sum(baccarat_value(c) for c in cards) % 10
+    return sum(_VAL[c] for c in cards) % 10
+
+
+@njit(cache=True, inline="always")
+def _mod10(x):
+    """
+    x % 10 for 0 <= x <= 29 with compare-and-subtract instead of a divide.
+    """
+    x -= 10 if x >= 10 else 0
+    x -= 10 if x >= 10 else 0
+    return x
+
+
+@njit(cache=True, inline="always")
+def _winner_code(p_total, b_total):
+    """
+    index into WINNER_CODES: 0 = P, 1 = B, 2 = T.
+    """
+    if p_total > b_total:
+        return 0
+    if b_total > p_total:
+        return 1
+    return 2
 
 
-def deal_card(shoe: List[int], pos: int) -> Tuple[int, int]:
-    if pos >= len(shoe):
+@njit(cache=True)
+def play_hand_nb(shoe, pos):
+    """
+    numba kernel: deal one hand from the int8 `shoe` starting at `pos`.
+
+    returns a flat tuple of scalars (no per-hand allocations):
+        (p0, p1, p2, b0, b1, b2, np_cards, nb_cards,
+         p_total, b_total, winner_code, natural, new_pos)
+
+    p2 / b2 are -1 when no third card was dealt. winner_code indexes
+    WINNER_CODES (0 = P, 1 = B, 2 = T).
+    """
+    n = len(shoe)
+    if pos + 4 > n:
         raise IndexError("shoe out of cards")
-    return shoe[pos], pos + 1
 
+    # initial deal: P1, B1, P2, B2
+    p0 = int(shoe[pos])
+    b0 = int(shoe[pos + 1])
+    p1 = int(shoe[pos + 2])
+    b1 = int(shoe[pos + 3])
+    pos += 4
+
+    p_total = _mod10(_VAL[p0] + _VAL[p1])
+    b_total = _mod10(_VAL[b0] + _VAL[b1])
+
+    # natural: no third cards, skip the drawing rules entirely
+    if p_total >= 8 or b_total >= 8:
+        return (p0, p1, -1, b0, b1, -1, 2, 2,
+                p_total, b_total, _winner_code(p_total, b_total), True, pos)
+
+    p2 = -1
+    b2 = -1
+    np_cards = 2
+    nb_cards = 2
+
+    if p_total <= 5:
+        # player draws third card
+        if pos >= n:
+            raise IndexError("shoe out of cards")
+        p2 = int(shoe[pos])
+        pos += 1
+        np_cards = 3
+        p2v = _VAL[p2]
+        p_total = _mod10(p_total + p2v)
+
+        # banker reacts based on player's third card
+        draw = BANKER_DRAW[b_total, p2v]
+    else:
+        # player stands on 6 or 7
+        draw = BANKER_STAND_DRAW[b_total]
+
+    if draw:
+        if pos >= n:
+            raise IndexError("shoe out of cards")
+        b2 = int(shoe[pos])
+        pos += 1
+        nb_cards = 3
+        b_total = _mod10(b_total + _VAL[b2])
 
-def play_hand(shoe: List[int], pos: int) -> Tuple[HandResult, int]:
+    return (p0, p1, p2, b0, b1, b2, np_cards, nb_cards,
+            p_total, b_total, _winner_code(p_total, b_total), False, pos)
+
+
+def play_hand(shoe: np.ndarray, pos: int) -> Tuple[HandResult, int]:
     """
     deal one baccarat hand from `shoe` starting at index `pos`.
+    thin wrapper over play_hand_nb that materializes a HandResult.
+
+    `shoe` may be any sequence of ranks; it's coerced to a contiguous int8
+    array (a no-op for shoes from build_shoe) so the kernel only ever sees
+    the one type it was compiled for.
 
     returns:
         (HandResult, new_pos)
     """
-
-    # initial deal: P1, B1, P2, B2
-    p_cards: List[int] = []
-    b_cards: List[int] = []
-
-    c, pos = deal_card(shoe, pos)
-    p_cards.append(c)
-    c, pos = deal_card(shoe, pos)
-    b_cards.append(c)
-    c, pos = deal_card(shoe, pos)
-    p_cards.append(c)
-    c, pos = deal_card(shoe, pos)
-    b_cards.append(c)
-
-    p_total = hand_total(p_cards)
-    b_total = hand_total(b_cards)
-    natural = False
-
-    # natural check
-    if p_total in (8, 9) or b_total in (8, 9):
-        natural = True
-        # no third cards
-    else:
-        # player action
-        if p_total <= 5:
-            # player draws third card
-            c, pos = deal_card(shoe, pos)
-            p_cards.append(c)
-            p_total = hand_total(p_cards)
-
-            # banker reacts based on player's third card
-            p3_val = baccarat_value(c)
-            b_total = hand_total(b_cards)
-
-            if b_total <= 2:
-                c, pos = deal_card(shoe, pos)
-                b_cards.append(c)
-            elif b_total == 3 and p3_val != 8:
-                c, pos = deal_card(shoe, pos)
-                b_cards.append(c)
-            elif b_total == 4 and p3_val in (2, 3, 4, 5, 6, 7):
-                c, pos = deal_card(shoe, pos)
-                b_cards.append(c)
-            elif b_total == 5 and p3_val in (4, 5, 6, 7):
-                c, pos = deal_card(shoe, pos)
-                b_cards.append(c)
-            elif b_total == 6 and p3_val in (6, 7):
-                c, pos = deal_card(shoe, pos)
-                b_cards.append(c)
-            # 7 stands, or conditions not met = stand
-        else:
-            # player stands on 6 or 7
-            b_total = hand_total(b_cards)
-            if b_total <= 5:
-                c, pos = deal_card(shoe, pos)
-                b_cards.append(c)
-
-        # final totals after possible draws
-        p_total = hand_total(p_cards)
-        b_total = hand_total(b_cards)
-
-    # decide winner
-    if p_total > b_total:
-        winner = "P"
-    elif b_total > p_total:
-        winner = "B"
-    else:
-        winner = "T"
+    shoe = np.ascontiguousarray(shoe, dtype=np.int8)
+    (p0, p1, p2, b0, b1, b2, np_cards, nb_cards,
+     p_total, b_total, winner_code, natural, pos) = play_hand_nb(shoe, pos)
 
     result = HandResult(
         shoe_id=-1,           # filled by caller
         hand_number=-1,       # filled by caller
-        player_cards=p_cards,
-        banker_cards=b_cards,
-        player_total=p_total,
-        banker_total=b_total,
-        winner=winner,
-        natural=natural,
+        player_cards=[int(p0), int(p1), int(p2)][:np_cards],
+        banker_cards=[int(b0), int(b1), int(b2)][:nb_cards],
+        player_total=int(p_total),
+        banker_total=int(b_total),
+        winner=WINNER_CODES[winner_code],
+        natural=bool(natural),
     )
-    return result, pos
+    return result, int(pos)
+
+
+@njit(cache=True, parallel=True)
+def run_all(shoes, burn, max_hands, first_shoe_id,
+            out_shoe_id, out_hand_number, out_p_cards, out_b_cards,
+            out_p_len, out_b_len, out_p_total, out_b_total,
+            out_winner, out_natural):
+    """
+    numba kernel: play every shoe (one per row of `shoes`) in parallel.
+
+    shoe i owns output rows [i * max_hands, (i + 1) * max_hands); rows it
+    doesn't fill keep hand_number 0 (see compact_results).
+    """
+    num_shoes = len(shoes)
+    for i in prange(num_shoes):
+        shoe = shoes[i]
+        n = len(shoe)
+        row = i * max_hands
+        # burn/cut cards from top of shoe
+        pos = min(n, burn)
+        hand_number = 1
+
+        # loop while there are enough cards left to deal a worst-case hand (6 cards)
+        while hand_number <= max_hands and pos + 6 <= n:
+            (p0, p1, p2, b0, b1, b2, np_cards, nb_cards,
+             p_total, b_total, winner_code, natural, pos) = play_hand_nb(shoe, pos)
+            out_shoe_id[row] = first_shoe_id + i
+            out_hand_number[row] = hand_number
+            out_p_cards[row, 0] = p0
+            out_p_cards[row, 1] = p1
+            out_p_cards[row, 2] = p2
+            out_b_cards[row, 0] = b0
+            out_b_cards[row, 1] = b1
+            out_b_cards[row, 2] = b2
+            out_p_len[row] = np_cards
+            out_b_len[row] = nb_cards
+            out_p_total[row] = p_total
+            out_b_total[row] = b_total
+            out_winner[row] = winner_code
+            out_natural[row] = natural
+            row += 1
+            hand_number += 1
 
 
 # ---------- simulation wrappers ----------
 
+def max_hands_per_shoe(
+    num_decks: int,
+    burn_cards: int = 0,
+    max_hands: Optional[int] = None,
+) -> int:
+    """
+    upper bound on hands a shoe can produce (every hand uses >= 4 cards).
+    used to size the result arrays up front.
+    """
+    cap = max(0, num_decks * 52 - max(0, int(burn_cards))) // 4
+    if max_hands is not None:
+        cap = min(cap, max(0, max_hands))
+    return cap
+
+
+# shoes per batch handed to run_all (and per pool task). fixed so the
+# output for a given seed doesn't depend on the worker count.
+SHOES_PER_BATCH = 256
+
+
+def _simulate_batch(
+    first_shoe_id: int,
+    num_shoes: int,
+    num_decks: int,
+    burn_cards: int,
+    max_hands: Optional[int],
+    rng: np.random.Generator,
+    shoes: Optional[np.ndarray] = None,
+) -> Results:
+    """
+    build, shuffle and play `num_shoes` shoes with a single kernel call.
+    `shoes` is an optional reusable buffer, see build_shoes.
+    """
+    cap = max_hands_per_shoe(num_decks, burn_cards, max_hands)
+    shoes = build_shoes(num_shoes, num_decks, rng, out=shoes)
+    kernel = run_all if run_all_native is None else run_all_native
+    if kernel is run_all and not HAVE_NUMBA:
+        # interpreted kernel: indexing packed array('b') rows hands back
+        # plain python ints instead of boxing a numpy scalar per card
+        shoes = [array("b", row.tobytes()) for row in shoes]
+    out = alloc_results(num_shoes * cap)
+    kernel(
+        shoes, max(0, int(burn_cards)), cap, first_shoe_id,
+        out["shoe_id"], out["hand_number"], out["p_cards"], out["b_cards"],
+        out["p_len"], out["b_len"], out["p_total"], out["b_total"],
+        out["winner"], out["natural"],
+    )
+    return compact_results(out)
+
+
 def simulate_shoe(
     shoe_id: int,
     num_decks: int = 8,
     burn_cards: int = 0,
     max_hands: Optional[int] = None,
     rng_seed: Optional[int] = None,
-) -> List[HandResult]:
+    rng: Optional[np.random.Generator] = None,
+    return_arrays: bool = True,
+) -> Union[Results, List[HandResult]]:
     """
     simulate a single shoe.
 
@@ -170,28 +458,49 @@ def simulate_shoe(
     - burn_cards: how many cards to remove from the top at the start
         (this is where you mirror "cut 10 cards" / "cut 8 cards")
     - max_hands: cap on number of hands dealt (e.g. 40)
+    - rng: generator to shuffle with; rng_seed is ignored when given
+    - return_arrays: False returns a list of HandResult instead
     """
+    if rng is None:
+        rng = np.random.default_rng(rng_seed)
+    results = _simulate_batch(shoe_id, 1, num_decks, burn_cards, max_hands, rng)
+    return results if return_arrays else _to_handresults(results)
 
-    rng = random.Random(rng_seed)
-    shoe = build_shoe(num_decks, rng)
-    pos = 0
 
-    # burn/cut cards from top of shoe
-    burn_cards = max(0, int(burn_cards))
-    pos = min(len(shoe), pos + burn_cards)
+def _shoe_buffer(num_shoes: int, num_decks: int) -> np.ndarray:
+    """
+    int8 buffer for one batch of shoes, reused across batches.
+    """
+    return np.empty((min(SHOES_PER_BATCH, num_shoes), num_decks * 52), dtype=np.int8)
+
 
-    results: List[HandResult] = []
-    hand_number = 1
+# per-process shoe buffer, allocated once by _init_worker
+_worker_shoes: Optional[np.ndarray] = None
 
-    # loop while there are enough cards left to deal a worst-case hand (6 cards)
-    while (max_hands is None or hand_number <= max_hands) and (pos + 6) <= len(shoe):
-        res, pos = play_hand(shoe, pos)
-        res.shoe_id = shoe_id
-        res.hand_number = hand_number
-        results.append(res)
-        hand_number += 1
 
-    return results
+def _init_worker(num_shoes: int, num_decks: int) -> None:
+    """
+    pool initializer: one numba thread per process (the pool already
+    spreads batches across cores) and one shoe buffer for its batches.
+    """
+    global _worker_shoes
+    set_num_threads(1)
+    _worker_shoes = _shoe_buffer(num_shoes, num_decks)
+
+
+def _simulate_batch_worker(
+    task: Tuple[int, int, int, int, Optional[int], np.random.Generator],
+) -> Tuple[int, Results]:
+    """
+    pool entry point: simulate one batch of shoes and tag it with its first
+    shoe id so the parent can restore shoe order after imap_unordered.
+    """
+    first_shoe_id, num_shoes, num_decks, burn_cards, max_hands, rng = task
+    res = _simulate_batch(
+        first_shoe_id, num_shoes, num_decks, burn_cards, max_hands, rng,
+        shoes=_worker_shoes,
+    )
+    return first_shoe_id, res
 
 
 def simulate_many_shoes(
@@ -200,56 +509,86 @@ def simulate_many_shoes(
     burn_cards: int = 0,
     max_hands: Optional[int] = 40,
     rng_seed: Optional[int] = None,
-) -> List[HandResult]:
+    workers: Optional[int] = 1,
+    return_arrays: bool = True,
+) -> Union[Results, List[HandResult]]:
     """
-    simulate multiple shoes and return a flat list of HandResult.
+    simulate multiple shoes and return struct-of-arrays results,
+    one row per hand in shoe / hand order.
+
+    shoes are played in batches of SHOES_PER_BATCH by the parallel run_all
+    kernel.
+
+    - workers: processes to spread batches over (None = all cores).
+        output is identical for any worker count given the same seed.
+    - return_arrays: False returns a flat list of HandResult instead
+        (export_to_csv only takes the arrays)
     """
-    all_results: List[HandResult] = []
-    rng = random.Random(rng_seed)
+    first_ids = list(range(1, num_shoes + 1, SHOES_PER_BATCH))
+    # independent child stream per batch, spawned from one seeded generator
+    child_rngs = np.random.default_rng(rng_seed).spawn(len(first_ids))
+    tasks = [
+        (first_id, min(SHOES_PER_BATCH, num_shoes + 1 - first_id),
+         num_decks, burn_cards, max_hands, child_rng)
+        for first_id, child_rng in zip(first_ids, child_rngs)
+    ]
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers > 1 and len(tasks) > 1:
+        parts = {}
+        with mp.Pool(
+            min(workers, len(tasks)),
+            initializer=_init_worker,
+            initargs=(num_shoes, num_decks),
+        ) as pool:
+            for first_id, res in pool.imap_unordered(_simulate_batch_worker, tasks):
+                parts[first_id] = res
+        results = concat_results([parts[first_id] for first_id in first_ids])
+    else:
+        shoes = _shoe_buffer(num_shoes, num_decks)
+        results = concat_results([_simulate_batch(*task, shoes=shoes) for task in tasks])
+
+    return results if return_arrays else _to_handresults(results)
 
-    for shoe_id in range(1, num_shoes + 1):
-        # different seed per shoe for variety
-        seed = rng.randint(0, 10**9)
-        shoe_results = simulate_shoe(
-            shoe_id=shoe_id,
-            num_decks=num_decks,
-            burn_cards=burn_cards,
-            max_hands=max_hands,
-            rng_seed=seed,
-        )
-        all_results.extend(shoe_results)
 
-    return all_results
+def _card_strings(cards: np.ndarray) -> np.ndarray:
+    """
+    format an (n, 3) card block as dash-separated ranks, e.g. "9-8-1",
+    leaving out the -1 third-card slot. vectorized, no per-row python.
+    """
+    two = np.char.add(np.char.add(cards[:, 0].astype("U2"), "-"), cards[:, 1].astype("U2"))
+    three = np.char.add(np.char.add(two, "-"), cards[:, 2].astype("U2"))
+    return np.where(cards[:, 2] >= 0, three, two)
 
 
-def export_to_csv(results: List[HandResult], path: str) -> None:
+def export_to_csv(results: Results, path: str) -> None:
     """
     write results to a csv file.
     player_cards / banker_cards are stored as dash-separated ranks, e.g. "9-8-1"
     """
+    columns = {
+        "shoe_id": results["shoe_id"],
+        "hand_number": results["hand_number"],
+        "player_cards": _card_strings(results["p_cards"]),
+        "banker_cards": _card_strings(results["b_cards"]),
+        "player_total": results["p_total"],
+        "banker_total": results["b_total"],
+        "winner": np.array(list(WINNER_CODES))[results["winner"]],
+        "natural": results["natural"].astype(np.int8),
+    }
+
+    if pd is not None:
+        # match the csv module's line endings so both paths write the same file
+        pd.DataFrame(columns).to_csv(path, index=False, lineterminator="\r\n")
+        return
+
     with open(path, "w", newline="") as f:
         writer = csv.writer(f)
-        writer.writerow([
-            "shoe_id",
-            "hand_number",
-            "player_cards",
-            "banker_cards",
-            "player_total",
-            "banker_total",
-            "winner",
-            "natural",
-        ])
-        for r in results:
-            writer.writerow([
-                r.shoe_id,
-                r.hand_number,
-                "-".join(str(c) for c in r.player_cards),
-                "-".join(str(c) for c in r.banker_cards),
-                r.player_total,
-                r.banker_total,
-                r.winner,
-                int(r.natural),
-            ])
+        writer.writerow(list(columns))
+        # one writerows call: csv's C loop pulls the row tuples from zip
+        writer.writerows(zip(*(c.tolist() for c in columns.values())))
 
 
 # ---------- cli ----------
@@ -290,6 +629,12 @@ def main(argv=None) -> None:
         default=None,
         help="random seed for reproducibility.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="worker processes for simulating shoes (0 = all cores).",
+    )
     parser.add_argument(
         "--output",
         "-o",
@@ -306,10 +651,11 @@ def main(argv=None) -> None:
         burn_cards=args.burn_cards,
         max_hands=args.max_hands,
         rng_seed=args.seed,
+        workers=args.workers or None,
     )
 
     export_to_csv(results, args.output)
-    print(f"simulated {args.num_shoes} shoes -> {len(results)} hands written to {args.output}")
+    print(f"simulated {args.num_shoes} shoes -> {len(results['shoe_id'])} hands written to {args.output}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+ahead-of-time build of the baccarat kernels with numba.pycc.
+
+produces a `baccarat_native` extension module next to this file. when it
+is importable, baccarat_sim uses its run_all instead of the jit kernel, so
+cli runs skip numba's first-run compile (and don't need numba at runtime).
+
+the native run_all is single-threaded; use --workers to spread batches
+over cores.
+
+usage:
+    python compile_baccarat.py
+"""
+
+import os
+
+from numba.pycc import CC
+
+import baccarat_sim
+
+# run_all(shoes, burn, max_hands, first_shoe_id,
+#         out_shoe_id, out_hand_number, out_p_cards, out_b_cards,
+#         out_p_len, out_b_len, out_p_total, out_b_total,
+#         out_winner, out_natural)
+RUN_ALL_SIG = (
+    "void(i1[:, ::1], i8, i8, i8,"
+    " i4[::1], i4[::1], i1[:, ::1], i1[:, ::1],"
+    " i1[::1], i1[::1], i1[::1], i1[::1],"
+    " i1[::1], b1[::1])"
+)
+
+cc = CC("baccarat_native")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# prange compiles as a plain range outside parallel=True
+cc.export("run_all", RUN_ALL_SIG)(baccarat_sim.run_all.py_func)
+
+
+if __name__ == "__main__":
+    cc.compile()